@@ -7,6 +7,7 @@ This package exposes:
 - tools: tool functions and registry.
 - agent_core: the main agent with reasoning + tool-calling + reflection.
 - evaluation: evaluation harness.
+- conversation: session state with summarized history for multi-turn chats.
 - cli_demo: CLI for interactive usage.
 - post_generator: LinkedIn-style post generator.
 """
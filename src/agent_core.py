@@ -16,9 +16,10 @@ client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 # =========================================
 # GROQ MODEL RESPONSE FUNCTION
 # =========================================
-def llm_generate(prompt: str, max_new_tokens: int = 200) -> str:
+def llm_generate(prompt: str, max_new_tokens: int = 200, raise_errors: bool = False) -> str:
     """
-    Uses Groq to generate responses with Llama 3.3 70B model
+    Uses Groq to generate responses with Llama 3.3 70B model.
+    With raise_errors=True, API errors are raised instead of returned as text.
     """
     try:
         response = client.chat.completions.create(
@@ -28,6 +29,8 @@ def llm_generate(prompt: str, max_new_tokens: int = 200) -> str:
         return response.choices[0].message.content.strip()
 
     except Exception as e:
+        if raise_errors:
+            raise
         return f"Error calling Groq API: {e}"
 
 
@@ -40,6 +43,19 @@ def _ensure_reflection(answer: str) -> str:
     return answer.strip()
 
 
+# =========================================
+# CONVERSATION CONTEXT (session mode)
+# =========================================
+def _with_context(prompt: str, context: str = "") -> str:
+    if not context:
+        return prompt
+    return f"""
+    Conversation context (earlier turns and retrieved knowledge):
+    {context}
+    {prompt}
+    """
+
+
 # =========================================
 # TOOL PARSING (ACTION/INPUT format)
 # =========================================
@@ -71,7 +87,7 @@ I was designed as part of a Ciklum AI Academy–inspired learning experience.
 # ===========================================================
 #                    MAIN AGENT FUNCTION
 # ===========================================================
-def agent_answer(user_query: str) -> str:
+def agent_answer(user_query: str, context: str = "") -> str:
     q = user_query.lower().strip()
 
     # -----------------------------------------------------------------
@@ -89,7 +105,7 @@ def agent_answer(user_query: str) -> str:
         Do NOT mention tools or internal code.
         End with: Reflection: <confidence>.
         """
-        return _ensure_reflection(llm_generate(prompt))
+        return _ensure_reflection(llm_generate(_with_context(prompt, context)))
 
 
     # -----------------------------------------------------------------
@@ -117,7 +133,7 @@ def agent_answer(user_query: str) -> str:
         Tone: Professional, human-like, enthusiastic — NOT robotic.
         End with: Reflection: <confidence score>.
         """
-        return _ensure_reflection(llm_generate(prompt))
+        return _ensure_reflection(llm_generate(_with_context(prompt, context)))
 
 
     # -----------------------------------------------------------------
@@ -136,7 +152,7 @@ def agent_answer(user_query: str) -> str:
         • Ciklum AI Academy educational purpose
         End with: Reflection: <confidence>.
         """
-        return _ensure_reflection(llm_generate(prompt))
+        return _ensure_reflection(llm_generate(_with_context(prompt, context)))
 
 
     # -----------------------------------------------------------------
@@ -154,7 +170,7 @@ def agent_answer(user_query: str) -> str:
         • Mention 'agentic AI' and 'RAG'
         End with: Reflection: <confidence>.
         """
-        return _ensure_reflection(llm_generate(prompt))
+        return _ensure_reflection(llm_generate(_with_context(prompt, context)))
 
 
     # -----------------------------------------------------------------
@@ -170,7 +186,7 @@ def agent_answer(user_query: str) -> str:
         Explain this file's purpose in 2–4 sentences.
         End with: Reflection: <confidence>.
         """
-        return _ensure_reflection(llm_generate(prompt))
+        return _ensure_reflection(llm_generate(_with_context(prompt, context)))
 
 
     # -----------------------------------------------------------------
@@ -188,7 +204,7 @@ def agent_answer(user_query: str) -> str:
         • How the system can improve
         End with: Reflection: <confidence>.
         """
-        return _ensure_reflection(llm_generate(prompt))
+        return _ensure_reflection(llm_generate(_with_context(prompt, context)))
 
 
     # -----------------------------------------------------------------
@@ -203,4 +219,4 @@ def agent_answer(user_query: str) -> str:
     Respond in 2–4 sentences.
     End with: Reflection: <confidence>.
     """
-    return _ensure_reflection(llm_generate(final_prompt))
+    return _ensure_reflection(llm_generate(_with_context(final_prompt, context)))
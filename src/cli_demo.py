@@ -1,6 +1,6 @@
 # src/cli_demo.py
 
-from src.agent_core import agent_answer
+from src.conversation import ConversationSession
 
 def main():
     print(
@@ -25,11 +25,14 @@ Examples:
 - Please list repository files.
 - Read file: README.md
 - Run a self evaluation.
-Type 'exit' or 'quit' to leave.
+Follow-up questions keep the context of the conversation.
+Type 'reset' to start a new conversation, 'exit' or 'quit' to leave.
 ============================================================
 """
     )
 
+    session = ConversationSession()
+
     while True:
         try:
             user_input = input("You> ").strip()
@@ -41,6 +44,11 @@ Type 'exit' or 'quit' to leave.
             print("Exiting. Goodbye!")
             break
 
+        if user_input.lower() == "reset":
+            session.reset()
+            print("Conversation reset.\n")
+            continue
+
         # Smart parsing for common intents:
         if user_input.lower().startswith("read file:"):
             path = user_input.split(":", 1)[1].strip()
@@ -55,7 +63,7 @@ Type 'exit' or 'quit' to leave.
             agent_query = user_input
 
         print("\nAgent is thinking...\n")
-        answer = agent_answer(agent_query)
+        answer = session.ask(agent_query, display_query=user_input)
         print(f"Agent>\n{answer}\n")
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+# src/conversation.py
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .rag_pipeline import cosine_similarity, embed_query, retrieve_chunks_for_vector
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate (~4 characters per token) — no tokenizer needed.
+    """
+    return len(text) // 4 + 1
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + " ..."
+
+
+def _format_turn(user: str, answer: str) -> str:
+    return f"User: {user}\nAgent: {answer}"
+
+
+# Lazy imports: importing agent_core loads tools.py, which builds the vector store.
+def _llm_generate(prompt: str, **kwargs) -> str:
+    from . import agent_core
+    return agent_core.llm_generate(prompt, **kwargs)
+
+
+def _agent_answer(user_query: str, context: str) -> str:
+    from . import agent_core
+    return agent_core.agent_answer(user_query, context=context)
+
+
+class ConversationSession:
+    """
+    Keeps conversation state across turns so follow-up questions work.
+
+    - Recent turns are kept verbatim until `history_token_budget` is exceeded;
+      the oldest turns are then folded in one batch into a running summary,
+      down to about half the budget, so summarization runs every few turns.
+      The latest turn always stays verbatim (cut to the budget if needed).
+    - The summary and the retrieved knowledge are capped, so the answer prompt
+      stays roughly the same size no matter how long the conversation runs.
+    - The previous chunks are reused when the new query is similar to the
+      previous one. Otherwise retrieval runs on the query together with the
+      previous question, so follow-ups like "Can you explain that?" stay on topic.
+    """
+
+    def __init__(
+        self,
+        history_token_budget: int = 600,
+        summary_max_tokens: int = 200,
+        knowledge_max_tokens: int = 400,
+        top_k: int = 3,
+        reuse_threshold: float = 0.6,
+    ):
+        self.history_token_budget = history_token_budget
+        self.summary_max_tokens = summary_max_tokens
+        self.knowledge_max_tokens = knowledge_max_tokens
+        self.top_k = top_k
+        self.reuse_threshold = reuse_threshold
+        self.reset()
+
+    def reset(self):
+        self.summary = ""
+        self.turns: List[Tuple[str, str]] = []
+        self._last_query_vec: Optional[np.ndarray] = None
+        self._last_chunks: List[str] = []
+
+        # Simple counters, handy for the CLI and the benchmark.
+        self.num_turns = 0
+        self.num_retrievals = 0
+        self.num_summarizations = 0
+
+    # ---------------------------------------------
+    # Retrieval (with reuse of the previous turn)
+    # ---------------------------------------------
+    def _retrieve(self, query: str) -> List[str]:
+        query_vec = embed_query(query)
+        last_vec, self._last_query_vec = self._last_query_vec, query_vec
+        if last_vec is not None and self._last_chunks:
+            if float(cosine_similarity(query_vec, last_vec)) >= self.reuse_threshold:
+                return self._last_chunks
+
+        # The previous question is only used to steer retrieval, not the reuse check.
+        search_vec = embed_query(f"{self.turns[-1][0]}\n{query}") if self.turns else query_vec
+        self._last_chunks = retrieve_chunks_for_vector(search_vec, top_k=self.top_k)
+        self.num_retrievals += 1
+        return self._last_chunks
+
+    # ---------------------------------------------
+    # Incremental summarization of older turns
+    # ---------------------------------------------
+    def _history_tokens(self) -> int:
+        return sum(_estimate_tokens(_format_turn(u, a)) for u, a in self.turns)
+
+    def _compact_history(self):
+        if self._history_tokens() <= self.history_token_budget:
+            return
+
+        # The latest turn stays verbatim so follow-ups can refer to it; cut it to the budget.
+        user, answer = self.turns[-1]
+        # (one token is left for the " ..." marker added on truncation)
+        answer_budget = max(1, self.history_token_budget - _estimate_tokens(_format_turn(user, "")) - 1)
+        self.turns[-1] = (user, _truncate_to_tokens(answer, answer_budget))
+
+        # Fold the older turns until the rest fits in half the budget.
+        target = self.history_token_budget // 2
+        folded: List[Tuple[str, str]] = []
+        while len(self.turns) > 1 and self._history_tokens() > target:
+            folded.append(self.turns.pop(0))
+        if not folded:
+            return
+
+        exchanges = "\n\n".join(_format_turn(u, a) for u, a in folded)
+        prompt = f"""
+        Current conversation summary:
+        {self.summary or "(empty)"}
+
+        New exchanges to merge in:
+        {exchanges}
+
+        Rewrite the summary so it includes the new exchanges.
+        Keep names, topics and facts the user may refer back to.
+        Use at most {self.summary_max_tokens * 3 // 4} words. Return only the summary.
+        """
+        try:
+            new_summary = _llm_generate(prompt, raise_errors=True)
+        except Exception:
+            # Keep the turns verbatim and try again on a later turn.
+            self.turns = folded + self.turns
+            return
+
+        self.summary = _truncate_to_tokens(new_summary.strip(), self.summary_max_tokens)
+        self.num_summarizations += 1
+
+    # ---------------------------------------------
+    # Context building
+    # ---------------------------------------------
+    def build_context(self, query: str) -> str:
+        parts = []
+        if self.summary:
+            parts.append(f"Summary of earlier conversation:\n{self.summary}")
+        if self.turns:
+            recent = "\n\n".join(_format_turn(u, a) for u, a in self.turns)
+            parts.append(f"Recent turns:\n{recent}")
+
+        chunks = self._retrieve(query)
+        if chunks:
+            knowledge = _truncate_to_tokens("\n---\n".join(chunks), self.knowledge_max_tokens)
+            parts.append(f"Retrieved knowledge:\n{knowledge}")
+
+        return "\n\n".join(parts)
+
+    def ask(self, user_query: str, display_query: Optional[str] = None) -> str:
+        """
+        Answer one turn of the conversation and update the session state.
+
+        Args:
+            user_query: The query sent to the agent (may be a rewritten tool request).
+            display_query: What the user actually typed; used for retrieval and
+                stored in the history. Defaults to user_query.
+        """
+        shown = display_query or user_query
+        context = self.build_context(shown)
+        answer = _agent_answer(user_query, context)
+
+        self.turns.append((shown, answer))
+        self.num_turns += 1
+        self._compact_history()
+        return answer
@@ -0,0 +1,112 @@
+# src/conversation_benchmark.py
+from typing import Dict, List
+
+from . import agent_core
+from .conversation import ConversationSession, _estimate_tokens
+
+# Topic questions, each followed by a rephrasing (reuses the chunks) or a
+# pronoun follow-up (retrieves again, steered by the previous question).
+_QUESTIONS = [
+    "What is RAG and why is it used here?",
+    "Why is RAG used here?",
+    "Can you explain that in more detail?",
+    "Which embedding model do you use for RAG?",
+    "Which embedding model is used for RAG?",
+    "How were you built?",
+    "Tell me more about that.",
+    "Why was the project created?",
+    "Why was this project created?",
+    "How does tool calling work in this agent?",
+    "Give me an example of it.",
+]
+
+
+def _make_stub_llm(prompt_log: List[str], answer_words: int = 120):
+    """
+    Returns a fake llm_generate that records prompts and returns a fixed-size answer,
+    so the benchmark measures prompt growth and not Groq latency.
+    """
+    answer = " ".join(["word"] * answer_words) + "\n\nReflection: stubbed."
+
+    def _stub(prompt: str, max_new_tokens: int = 200, raise_errors: bool = False) -> str:
+        prompt_log.append(prompt)
+        return answer
+
+    return _stub
+
+
+def run_benchmark(num_turns: int = 60) -> Dict:
+    """
+    Run a multi-turn conversation against a stubbed LLM.
+
+    Latency is not measured: the stub returns instantly, so the number of
+    blocking LLM calls per turn is reported instead.
+
+    Returns:
+        A report with per-turn answer-prompt and summarization-prompt tokens.
+    """
+    prompt_log: List[str] = []
+    original_llm = agent_core.llm_generate
+    agent_core.llm_generate = _make_stub_llm(prompt_log)
+
+    session = ConversationSession()
+    per_turn: List[Dict] = []
+    try:
+        for turn in range(num_turns):
+            question = _QUESTIONS[turn % len(_QUESTIONS)]
+            start_idx = len(prompt_log)
+            session.ask(question)
+
+            # The first prompt of a turn is the answer; a second one is the summarization.
+            turn_prompts = prompt_log[start_idx:]
+            per_turn.append(
+                {
+                    "turn": turn + 1,
+                    "answer_prompt_tokens": _estimate_tokens(turn_prompts[0]),
+                    "summary_prompt_tokens": sum(_estimate_tokens(p) for p in turn_prompts[1:]),
+                    "llm_calls": len(turn_prompts),
+                }
+            )
+    finally:
+        agent_core.llm_generate = original_llm
+
+    return {
+        "turns": per_turn,
+        "num_retrievals": session.num_retrievals,
+        "num_summarizations": session.num_summarizations,
+    }
+
+
+def main():
+    report = run_benchmark()
+    turns = report["turns"]
+    warm = turns[len(turns) // 5:]
+    answer_tokens = [t["answer_prompt_tokens"] for t in warm]
+    summary_tokens = [t["summary_prompt_tokens"] for t in warm if t["summary_prompt_tokens"]]
+    totals = [t["answer_prompt_tokens"] + t["summary_prompt_tokens"] for t in warm]
+
+    print("\n=== Conversation Benchmark (stubbed LLM) ===")
+    print(f"Turns: {len(turns)}")
+    reused = len(turns) - report["num_retrievals"]
+    print(f"Retrievals: {report['num_retrievals']} (reused on {reused} turns, {reused / len(turns):.0%})")
+    print(f"Summarizations: {report['num_summarizations']} (one extra blocking LLM call on those turns)")
+
+    print("\nAfter warm-up:")
+    print(f"Answer prompt tokens — min: {min(answer_tokens)}, max: {max(answer_tokens)}")
+    if summary_tokens:
+        print(
+            f"Summarization prompt tokens — min: {min(summary_tokens)}, max: {max(summary_tokens)}, "
+            f"amortized per turn: {sum(summary_tokens) / len(warm):.0f}"
+        )
+    print(f"Total prompt tokens per turn — min: {min(totals)}, max: {max(totals)} (spikes on summarization turns)")
+
+    print("\n=== Per-turn details ===")
+    for t in turns:
+        print(
+            f"Turn {t['turn']:>3}: answer_prompt_tokens={t['answer_prompt_tokens']:>5}  "
+            f"summary_prompt_tokens={t['summary_prompt_tokens']:>5}  llm_calls={t['llm_calls']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
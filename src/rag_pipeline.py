@@ -69,13 +69,28 @@ def _ensure_vector_store_built():
         build_vector_store()
 
 
-def retrieve_relevant_chunks(query: str, top_k: int = 5) -> List[str]:
-    _ensure_vector_store_built()
+def cosine_similarity(vectors: np.ndarray, query_vec: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of one vector or a matrix of row vectors against query_vec.
+    """
+    return np.dot(vectors, query_vec) / (np.linalg.norm(vectors, axis=-1) * np.linalg.norm(query_vec) + 1e-10)
+
+
+def embed_query(query: str) -> np.ndarray:
     embedder = _get_embedder()
+    return embedder.encode([query], convert_to_numpy=True, show_progress_bar=False)[0]
+
 
-    query_vec = embedder.encode([query], convert_to_numpy=True, show_progress_bar=False)[0]
-    sims = np.dot(_CHUNK_EMBEDDINGS, query_vec) / (np.linalg.norm(_CHUNK_EMBEDDINGS, axis=1) * np.linalg.norm(query_vec) + 1e-10)
+def retrieve_chunks_for_vector(query_vec: np.ndarray, top_k: int = 5) -> List[str]:
+    _ensure_vector_store_built()
+
+    sims = cosine_similarity(_CHUNK_EMBEDDINGS, query_vec)
     top_k = max(1, min(top_k, len(_CHUNKS)))
     top_indices = np.argsort(sims)[-top_k:][::-1]
 
     return [_CHUNKS[i] for i in top_indices]
+
+
+def retrieve_relevant_chunks(query: str, top_k: int = 5) -> List[str]:
+    _ensure_vector_store_built()
+    return retrieve_chunks_for_vector(embed_query(query), top_k=top_k)
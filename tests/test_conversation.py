@@ -0,0 +1,128 @@
+# tests/test_conversation.py
+import numpy as np
+import pytest
+
+from src import conversation
+from src.conversation import ConversationSession, _truncate_to_tokens
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """
+    Replace the embedder, retriever and LLM so no model or Groq call is made.
+    Embeddings come from `vectors` (text -> vector); unknown texts get a fresh orthogonal vector.
+    """
+    state = {"vectors": {}, "retrievals": 0, "llm_prompts": [], "llm_error": False}
+
+    def fake_embed(text):
+        if text not in state["vectors"]:
+            vec = np.zeros(64)
+            vec[len(state["vectors"])] = 1.0
+            state["vectors"][text] = vec
+        return state["vectors"][text]
+
+    def fake_retrieve(query_vec, top_k=5):
+        state["retrievals"] += 1
+        return [f"chunk-{state['retrievals']}-{i}" for i in range(top_k)]
+
+    def fake_llm(prompt, **kwargs):
+        state["llm_prompts"].append(prompt)
+        if state["llm_error"]:
+            raise RuntimeError("Groq unavailable")
+        return "short summary"
+
+    monkeypatch.setattr(conversation, "embed_query", fake_embed)
+    monkeypatch.setattr(conversation, "retrieve_chunks_for_vector", fake_retrieve)
+    monkeypatch.setattr(conversation, "_llm_generate", fake_llm)
+    monkeypatch.setattr(conversation, "_agent_answer", lambda q, context: "answer " * 30)
+    return state
+
+
+def test_reuses_chunks_above_threshold(fake_backend):
+    session = ConversationSession(reuse_threshold=0.6)
+    session.ask("What is RAG?")
+    # The rephrased question embeds close to the first one.
+    fake_backend["vectors"]["Why is RAG used?"] = fake_backend["vectors"]["What is RAG?"] * 0.9 + 0.01
+    session.ask("Why is RAG used?")
+    assert session.num_retrievals == 1, "Similar follow-up should reuse the previous chunks."
+
+
+def test_retrieves_again_below_threshold(fake_backend):
+    session = ConversationSession(reuse_threshold=0.6)
+    session.ask("What is RAG?")
+    session.ask("How were you built?")
+    assert session.num_retrievals == 2, "Unrelated query should trigger a new retrieval."
+    assert fake_backend["retrievals"] == 2
+
+
+def test_shared_prefix_does_not_force_reuse(fake_backend):
+    session = ConversationSession(reuse_threshold=0.6)
+    session.ask("What is RAG and why is it used here?")
+    # The combined retrieval text shares the previous question, so it embeds close to it;
+    # the new topic on its own does not, and must trigger a new retrieval.
+    combined = "What is RAG and why is it used here?\nHow were you built?"
+    fake_backend["vectors"][combined] = fake_backend["vectors"]["What is RAG and why is it used here?"] + 0.01
+    session.ask("How were you built?")
+    assert session.num_retrievals == 2, "A new topic should not reuse the previous chunks."
+
+
+def test_reuse_compares_against_previous_turn(fake_backend):
+    session = ConversationSession(reuse_threshold=0.6)
+    a, c = np.eye(64)[60], np.eye(64)[61]
+    fake_backend["vectors"].update({"a": a, "b": (a + c) / np.sqrt(2), "c": c})
+    for q in ["a", "b", "c"]:
+        session.ask(q)
+    # "c" is far from "a" (which retrieved) but close enough to "b" (the previous turn).
+    assert session.num_retrievals == 1
+
+
+def test_long_answer_keeps_latest_turn(fake_backend, monkeypatch):
+    monkeypatch.setattr(conversation, "_agent_answer", lambda q, context: "post " * 600)
+    session = ConversationSession(history_token_budget=600)
+    session.ask("Write a LinkedIn post.")
+    session.ask("Make it shorter.")
+    assert len(session.turns) == 1, "The most recent turn should stay verbatim."
+    assert session.turns[0][0] == "Make it shorter."
+    assert session.turns[0][1].startswith("post post")
+    assert session._history_tokens() <= session.history_token_budget
+
+
+def test_history_is_folded_in_batches(fake_backend):
+    session = ConversationSession(history_token_budget=200)
+    for i in range(12):
+        session.ask(f"Question {i}")
+        assert session._history_tokens() <= session.history_token_budget
+    assert session.summary == "short summary"
+    assert 0 < session.num_summarizations < session.num_turns / 2, "Summarization should run every few turns."
+
+
+def test_failed_summarization_keeps_turns(fake_backend):
+    fake_backend["llm_error"] = True
+    session = ConversationSession(history_token_budget=100)
+    for i in range(3):
+        session.ask(f"Question {i}")
+    assert len(session.turns) == 3, "Turns must not be dropped when summarization fails."
+    assert session.summary == ""
+    assert session.num_summarizations == 0
+
+
+def test_history_stores_display_query(fake_backend):
+    session = ConversationSession()
+    session.ask("ACTION: run_eval_on_qa_set\nINPUT: ", display_query="Run a self evaluation.")
+    assert session.turns[0][0] == "Run a self evaluation."
+    assert "Run a self evaluation." in fake_backend["vectors"]
+
+
+def test_reset_clears_state_and_counters(fake_backend):
+    session = ConversationSession(history_token_budget=100)
+    for i in range(4):
+        session.ask(f"Question {i}")
+    session.reset()
+    assert session.summary == "" and session.turns == []
+    assert (session.num_turns, session.num_retrievals, session.num_summarizations) == (0, 0, 0)
+
+
+def test_truncate_to_tokens():
+    assert _truncate_to_tokens("short", 10) == "short"
+    truncated = _truncate_to_tokens("x" * 100, 5)
+    assert truncated == "x" * 20 + " ..."
@@ -0,0 +1,22 @@
+# tests/test_conversation_benchmark.py
+# Integration test: imports agent_core, which builds the real vector store and Groq client.
+# Only the LLM is stubbed; see tests/test_conversation.py for the hermetic unit tests.
+from src.conversation_benchmark import run_benchmark
+
+
+def test_answer_prompt_stays_flat_over_long_session():
+    report = run_benchmark(num_turns=50)
+    turns = report["turns"]
+    assert len(turns) == 50, "Benchmark should record every turn."
+
+    answer = [t["answer_prompt_tokens"] for t in turns]
+    summary = [t["summary_prompt_tokens"] for t in turns if t["summary_prompt_tokens"]]
+
+    # The answer prompt must not grow with the session.
+    assert max(answer[30:]) <= max(answer[10:30]) * 1.1, "Answer prompt should stay bounded."
+
+    # Summarization is a separate, bounded cost that runs every few turns, not every turn.
+    assert 0 < report["num_summarizations"] < len(turns) / 2
+    assert max(summary[len(summary) // 2:]) <= max(summary[: len(summary) // 2]) * 1.1, (
+        "Summarization prompt should not grow with the session."
+    )